@@ -2,7 +2,7 @@
 """
 Central configuration loader.
 
-- Uses pydantic.BaseSettings to pick up environment variables (and .env automatically).
+- Uses pydantic.BaseSettings to pick up environment variables (.env is loaded into os.environ once at import).
 - Loads config/config.yaml for defaults and non-secret settings.
 - Environment variables take precedence over YAML.
 - Exposes a simple Config wrapper with helper accessors.
@@ -15,18 +15,33 @@ Usage:
 """
 from __future__ import annotations
 
+import copy
+from collections import OrderedDict
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import yaml
+from dotenv import load_dotenv
 from pydantic import BaseSettings, Field
 
+try:  # prefer the libyaml-backed C loader when PyYAML was built with it
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - pure-Python fallback
+    from yaml import SafeLoader as _YamlLoader
+
 
 ROOT = Path(__file__).resolve().parents[3]
 ENV_FILE = ROOT / ".env"
 YAML_PATH = ROOT / "config" / "config.yaml"
 
+# Read .env once per process; real environment variables still win (override=False).
+load_dotenv(ENV_FILE, override=False)
+
+# Parsed YAML keyed by absolute path -> (mtime, size, data). Bounded LRU.
+_YAML_CACHE: "OrderedDict[str, Tuple[float, int, Dict[str, Any]]]" = OrderedDict()
+_YAML_CACHE_MAX = 100
+
 
 class Settings(BaseSettings):
     # App
@@ -56,19 +71,33 @@ class Settings(BaseSettings):
     secret_key: Optional[str] = Field(None, env="SECRET_KEY")
 
     class Config:
-        # load .env automatically (you can override or leave empty)
-        env_file = str(ENV_FILE)
-        env_file_encoding = "utf-8"
+        # .env is already in os.environ (see load_dotenv above), so no env_file here
         case_sensitive = False
 
 
 def _load_yaml(path: Path) -> Dict[str, Any]:
-    """Load YAML file into a dict. Returns empty dict if file missing or invalid."""
+    """Load YAML file into a dict. Returns empty dict if file missing or invalid.
+
+    Parsed results are cached per file and reused while mtime and size are unchanged.
+    A deep copy is returned so callers can't mutate the cached entry.
+    """
     try:
         if not path.exists():
             return {}
+        st = path.stat()
+        key = str(path.resolve())
+        cached = _YAML_CACHE.get(key)
+        if cached is not None and cached[0] == st.st_mtime and cached[1] == st.st_size:
+            _YAML_CACHE.move_to_end(key)
+            return copy.deepcopy(cached[2])
+
         with path.open("r", encoding="utf-8") as fh:
-            return yaml.safe_load(fh) or {}
+            data = yaml.load(fh, Loader=_YamlLoader) or {}
+        _YAML_CACHE[key] = (st.st_mtime, st.st_size, data)
+        _YAML_CACHE.move_to_end(key)
+        while len(_YAML_CACHE) > _YAML_CACHE_MAX:
+            _YAML_CACHE.popitem(last=False)
+        return copy.deepcopy(data)
     except Exception:
         # Keep failures non-fatal — settings from env should be primary source.
         return {}
@@ -84,17 +113,18 @@ class Config:
     def __init__(self, settings: Settings, yaml_config: Optional[Dict[str, Any]] = None) -> None:
         self._settings = settings
         self._yaml = yaml_config or {}
+        # settings are immutable after construction; snapshot once for plain dict lookups
+        self._env_map: Dict[str, Any] = settings.dict()
 
     # --- Settings (env-backed) accessors ---
     def get_env(self, key: str, default: Any = None) -> Any:
         """Return an env-backed setting by key. Keys are case-insensitive."""
         # normalize key to snake-case matching Settings attributes
-        attr = key.lower()
-        return getattr(self._settings, attr, default)
+        return self._env_map.get(key.lower(), default)
 
     def settings_dict(self) -> Dict[str, Any]:
         """Return pydantic settings as a dict (useful for logging/debugging)."""
-        return self._settings.dict()
+        return dict(self._env_map)
 
     # --- YAML accessors ---
     def get(self, section: str, key: str, default: Any = None) -> Any:
@@ -122,19 +152,31 @@ class Config:
     def to_dict(self) -> Dict[str, Any]:
         """Return merged view (settings + yaml) — env wins on conflicts."""
         merged = dict(self._yaml)
-        merged.update({k: v for k, v in self._settings.dict().items() if v is not None})
+        merged.update({k: v for k, v in self._env_map.items() if v is not None})
         return merged
 
 
-@lru_cache()
-def get_config(yaml_path: Optional[str] = None) -> Config:
-    """Return a cached Config object for the application."""
-    yaml_p = Path(yaml_path) if yaml_path else YAML_PATH
-    yaml_cfg = _load_yaml(yaml_p)
+@lru_cache(maxsize=8)
+def _build_config(path_str: str) -> Config:
+    """Build a Config for an already-resolved YAML path (cached per path)."""
+    yaml_cfg = _load_yaml(Path(path_str))
     settings = Settings()
     return Config(settings=settings, yaml_config=yaml_cfg)
 
 
+def get_config(yaml_path: Optional[str] = None) -> Config:
+    """Return a cached Config object for the application.
+
+    The path is resolved before the cache lookup so that ``None``, relative and
+    absolute spellings of the same file all share one Config instance.
+    """
+    yaml_p = Path(yaml_path) if yaml_path else YAML_PATH
+    return _build_config(str(yaml_p.resolve()))
+
+
+# keep the lru_cache-style reset available on the public entry point
+get_config.cache_clear = _build_config.cache_clear  # type: ignore[attr-defined]
+
 # Convenience alias used across the codebase
 get_settings = get_config
 
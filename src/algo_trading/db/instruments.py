@@ -0,0 +1,84 @@
+# File: src/algo_trading/db/instruments.py
+"""
+Bulk refresh helpers for the instrument_master reference table.
+- Small batches go through a single INSERT ... ON CONFLICT DO UPDATE per chunk.
+- Large refreshes COPY into a temp staging table and upsert from there in one statement.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .models import InstrumentMaster
+
+_PK_COLUMNS = ("security_id", "exchange_segment")
+_NO_UPDATE_COLUMNS = _PK_COLUMNS + ("created_at",)
+_MAX_BIND_PARAMS = 32767  # asyncpg / Postgres limit per statement
+_COPY_THRESHOLD = 10_000
+_STAGE_TABLE = "_instrument_master_stage"
+
+
+async def bulk_upsert_instruments(session: AsyncSession, rows: List[Dict[str, Any]]) -> None:
+    """
+    Insert or update instrument rows keyed by (security_id, exchange_segment).
+    All rows must share the same keys; duplicate keys collapse to the last row given.
+    The caller owns the transaction (commit afterwards); a rollback undoes the upsert on either path.
+    """
+    if not rows:
+        return
+    # ON CONFLICT can't touch the same row twice in one statement, so dedupe by PK first (last wins)
+    rows = list({tuple(row.get(c) for c in _PK_COLUMNS): row for row in rows}.values())
+    table = InstrumentMaster.__table__
+    columns = [c.name for c in table.columns if c.name in rows[0]]
+    update_columns = [c for c in columns if c not in _NO_UPDATE_COLUMNS]
+
+    if len(rows) > _COPY_THRESHOLD:
+        await _copy_upsert(session, rows, columns, update_columns)
+        return
+
+    chunk_size = max(1, _MAX_BIND_PARAMS // len(columns))
+    for start in range(0, len(rows), chunk_size):
+        stmt = pg_insert(table).values(rows[start:start + chunk_size])
+        if update_columns:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=list(_PK_COLUMNS),
+                set_={name: stmt.excluded[name] for name in update_columns},
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=list(_PK_COLUMNS))
+        await session.execute(stmt)
+
+
+async def _copy_upsert(
+    session: AsyncSession, rows: List[Dict[str, Any]], columns: List[str], update_columns: List[str]
+) -> None:
+    # COPY can't resolve conflicts itself, so stage the rows and upsert them with one INSERT ... SELECT.
+    conn = await session.connection()
+    col_list = ", ".join(columns)
+    if update_columns:
+        conflict = "DO UPDATE SET " + ", ".join(f"{c} = EXCLUDED.{c}" for c in update_columns)
+    else:
+        conflict = "DO NOTHING"
+
+    # Run through the session so this statement opens its transaction; ON COMMIT DROP (plus the DROP
+    # below) keeps the stage table from outliving it, and a failed COPY/INSERT goes with the rollback.
+    await conn.execute(
+        text(f"CREATE TEMP TABLE {_STAGE_TABLE} (LIKE instrument_master INCLUDING DEFAULTS) ON COMMIT DROP")
+    )
+    raw = await conn.get_raw_connection()
+    # only COPY needs the underlying asyncpg connection; it runs inside the transaction opened above
+    await raw.driver_connection.copy_records_to_table(
+        _STAGE_TABLE,
+        records=[tuple(row.get(c) for c in columns) for row in rows],
+        columns=columns,
+    )
+    await conn.execute(
+        text(
+            f"INSERT INTO instrument_master ({col_list}) SELECT {col_list} FROM {_STAGE_TABLE} "
+            f"ON CONFLICT ({', '.join(_PK_COLUMNS)}) {conflict}"
+        )
+    )
+    await conn.execute(text(f"DROP TABLE {_STAGE_TABLE}"))
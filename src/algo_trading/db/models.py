@@ -4,57 +4,90 @@ SQLModel models translated from your previous SQLAlchemy models.
 Keep these models in sync with Alembic migrations when you move to production.
 """
 from __future__ import annotations
-from datetime import datetime, date
-from typing import Optional
+from datetime import datetime, date, timedelta
+from typing import Any, Optional
 
 from sqlmodel import SQLModel, Field, Column
-from sqlalchemy import PrimaryKeyConstraint, Integer, String
+from sqlalchemy import DDL, BigInteger, DateTime, Enum as SAEnum, Index, Integer, Interval, REAL, String
+from sqlalchemy import FetchedValue, event, func
+
+
+# --- native Postgres enums for closed-vocabulary columns ---
+ExchangeEnum = SAEnum("NSE", "BSE", "MCX", name="exchange_enum")
+TransactionTypeEnum = SAEnum("BUY", "SELL", name="transaction_type_enum")
+ExecutionFlagEnum = SAEnum("Disabled", "Enabled", "Traded", "Exited", name="execution_flag_enum")
+
+
+# --- shared timestamp columns ---
+# A Column object can only belong to one table, so each model gets a fresh one from these helpers.
+# Values are server-side, so models set eager_defaults to get them back via RETURNING (no async lazy load).
+def _created_at_field() -> Any:
+    return Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False),
+    )
+
+
+def _updated_at_field() -> Any:
+    return Field(
+        default=None,
+        sa_column=Column(
+            DateTime(timezone=True),
+            server_default=func.now(),
+            onupdate=func.now(),
+            server_onupdate=FetchedValue(),
+            nullable=False,
+        ),
+    )
 
 
 # --- users & accounts (starter) ---
 class User(SQLModel, table=True):
     __tablename__ = "users"
+    __mapper_args__ = {"eager_defaults": True}
     id: Optional[int] = Field(default=None, primary_key=True)
-    first_name: Optional[str] = Field(default=None, sa_column=Column(String, nullable=True))
-    last_name: Optional[str] = Field(default=None, sa_column=Column(String, nullable=True))
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
     email: Optional[str] = Field(default=None, sa_column=Column(String, unique=True, index=True))
     password_hash: Optional[str] = None
     dhan_client_id: Optional[str] = Field(default=None, sa_column=Column(String, index=True))
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = _created_at_field()
 
 
 # --- instruments / master lists ---
 class AllInstrumentsList(SQLModel, table=True):
     __tablename__ = "all_instruments_list"
+    __mapper_args__ = {"eager_defaults": True}
     id: Optional[int] = Field(default=None, primary_key=True)
     sem_exm_exch_id: Optional[str] = Field(default=None)
     sem_segment: Optional[str] = Field(default=None)
-    sem_smst_security_id: Optional[str] = Field(default=None)
+    sem_smst_security_id: Optional[int] = Field(default=None)
     sem_instrument_name: Optional[str] = Field(default=None)
-    sem_expiry_code: Optional[str] = Field(default=None)
+    sem_expiry_code: Optional[int] = Field(default=None)
     sem_trading_symbol: Optional[str] = Field(default=None)
-    sem_lot_units: Optional[str] = Field(default=None)
+    sem_lot_units: Optional[int] = Field(default=None)
     sem_custom_symbol: Optional[str] = Field(default=None)
     sem_expiry_date: Optional[str] = Field(default=None)
-    sem_strike_price: Optional[str] = Field(default=None)
+    sem_strike_price: Optional[float] = Field(default=None)
     sem_option_type: Optional[str] = Field(default=None)
-    sem_tick_size: Optional[str] = Field(default=None)
+    sem_tick_size: Optional[float] = Field(default=None)
     sem_expiry_flag: Optional[str] = Field(default=None)
     sem_exch_instrument_type: Optional[str] = Field(default=None)
     sem_series: Optional[str] = Field(default=None)
     sm_symbol_name: Optional[str] = Field(default=None)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = _created_at_field()
 
 
 class InstrumentMaster(SQLModel, table=True):
     __tablename__ = "instrument_master"
+    __mapper_args__ = {"eager_defaults": True}
 
     # composite PK: security_id + exchange_segment
     security_id: int = Field(sa_column=Column("security_id", Integer, primary_key=True))
     exchange_segment: str = Field(sa_column=Column("exchange_segment", String(length=64), primary_key=True))
 
     trading_symbol: Optional[str] = Field(default=None)
-    exchange: Optional[str] = Field(default=None)
+    exchange: Optional[str] = Field(default=None, sa_column=Column(ExchangeEnum))
     segment: Optional[str] = Field(default=None)
     instrument: Optional[str] = Field(default=None)
 
@@ -66,19 +99,18 @@ class InstrumentMaster(SQLModel, table=True):
     strike_price: Optional[float] = Field(default=None)
     lot_size: Optional[int] = Field(default=None)
 
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-
-    __table_args__ = (PrimaryKeyConstraint("security_id", "exchange_segment"),)
+    created_at: Optional[datetime] = _created_at_field()
 
 
 # --- trade plan / user-saved opportunities ---
 class TradePlan(SQLModel, table=True):
     __tablename__ = "trade_plan"
+    __mapper_args__ = {"eager_defaults": True}
 
     trade_id: Optional[int] = Field(default=None, primary_key=True)
     user_id: Optional[int] = Field(default=None, nullable=True, index=True)  # multi-user mapping
     trading_symbol: str
-    exchange: str = Field(default="NSE")
+    exchange: str = Field(default="NSE", sa_column=Column(ExchangeEnum, nullable=False))
     instrument: str
 
     time_frame: str  # Daily, Hourly, 15 Min
@@ -95,12 +127,12 @@ class TradePlan(SQLModel, table=True):
     score: Optional[float] = None
 
     execution_strategy: Optional[str] = None
-    execution_flag: str = Field(default="Disabled")  # Disabled, Enabled, Traded, Exited
+    execution_flag: str = Field(default="Disabled", sa_column=Column(ExecutionFlagEnum, nullable=False))
     status: Optional[str] = None  # Pending / Executed / Exited
 
     notes: Optional[str] = None
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = _created_at_field()
+    updated_at: Optional[datetime] = _updated_at_field()
 
 
 # --- live trades (open positions) ---
@@ -112,11 +144,11 @@ class LiveTrade(SQLModel, table=True):
     trade_id: Optional[int] = Field(default=None)  # group id for multi-leg strategies
 
     trading_symbol: str
-    exchange: str = Field(default="NSE")
+    exchange: str = Field(default="NSE", sa_column=Column(ExchangeEnum, nullable=False))
     instrument: str
 
     ltp: Optional[float] = None
-    transaction_type: Optional[str] = None  # BUY / SELL
+    transaction_type: Optional[str] = Field(default=None, sa_column=Column(TransactionTypeEnum))
 
     entry_order_id: Optional[str] = None
     entry_price: Optional[float] = None
@@ -137,12 +169,13 @@ class LiveTrade(SQLModel, table=True):
 # --- trade log summary & detail ---
 class TradeLog(SQLModel, table=True):
     __tablename__ = "trade_log"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: Optional[int] = Field(default=None, nullable=True, index=True)
     trade_id: Optional[str] = Field(default=None)
     trading_symbol: Optional[str] = Field(default=None)
-    exchange: str = Field(default="NSE")
+    exchange: str = Field(default="NSE", sa_column=Column(ExchangeEnum, nullable=False))
     instrument: Optional[str] = Field(default=None)
 
     trade_direction: Optional[str] = Field(default=None)
@@ -157,23 +190,24 @@ class TradeLog(SQLModel, table=True):
     exit_time: Optional[str] = None
 
     pnl: Optional[float] = None
-    roi: Optional[str] = None
-    risk_reward: Optional[str] = None
-    holding_period: Optional[str] = None
+    roi: Optional[float] = Field(default=None, sa_column=Column(REAL))
+    risk_reward: Optional[float] = Field(default=None, sa_column=Column(REAL))
+    holding_period: Optional[timedelta] = Field(default=None, sa_column=Column(Interval))
 
     remark: Optional[str] = None
     notes: Optional[str] = None
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = _created_at_field()
 
 
 class TradeLogDetail(SQLModel, table=True):
     __tablename__ = "trade_log_detail"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: Optional[int] = Field(default=None, nullable=True, index=True)
     trade_id: Optional[str] = Field(default=None)
     trading_symbol: Optional[str] = Field(default=None)
-    exchange: str = Field(default="NSE")
+    exchange: str = Field(default="NSE", sa_column=Column(ExchangeEnum, nullable=False))
     instrument: Optional[str] = Field(default=None)
 
     entry_order_id: Optional[str] = None
@@ -184,19 +218,20 @@ class TradeLogDetail(SQLModel, table=True):
     exit_price: Optional[float] = None
     exit_quantity: Optional[int] = None
 
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = _created_at_field()
 
 
 # --- history, ledger, indicators ---
 class TradeHistory(SQLModel, table=True):
     __tablename__ = "trade_history"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: Optional[int] = Field(default=None, nullable=True, index=True)
     order_id: Optional[str] = None
     exchange_order_id: Optional[str] = None
     exchange_trade_id: Optional[str] = None
-    transaction_type: Optional[str] = None
+    transaction_type: Optional[str] = Field(default=None, sa_column=Column(TransactionTypeEnum))
     exchange_segment: Optional[str] = None
     product_type: Optional[str] = None
     order_type: Optional[str] = None
@@ -221,11 +256,12 @@ class TradeHistory(SQLModel, table=True):
     drv_option_type: Optional[str] = None
     drv_strike_price: Optional[float] = None
 
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = _created_at_field()
 
 
 class LedgerReport(SQLModel, table=True):
     __tablename__ = "ledger_report"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: Optional[int] = Field(default=None, nullable=True, index=True)
@@ -238,66 +274,104 @@ class LedgerReport(SQLModel, table=True):
     credit: Optional[float] = None
     running_balance: Optional[float] = None
 
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = _created_at_field()
 
 
 class IndicatorData(SQLModel, table=True):
     __tablename__ = "indicator_data"
-
-    id: Optional[int] = Field(default=None, primary_key=True)
+    __table_args__ = (
+        # covers the usual "one symbol, one timeframe, date range" fetch; INCLUDE allows index-only scans
+        Index(
+            "ix_indicator_sid_tf_dt",
+            "security_id",
+            "timeframe",
+            "datetime",
+            postgresql_include=["close", "ema_50", "rsi_14", "atr_14"],
+        ),
+        # rows arrive in time order, so a tiny BRIN index prunes date-range scans across symbols
+        Index(
+            "ix_indicator_dt_brin",
+            "datetime",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        {"postgresql_partition_by": "LIST (timeframe)"},
+    )
+
+    # timeframe is part of the PK because Postgres requires the partition key in it
+    id: Optional[int] = Field(default=None, sa_column=Column(Integer, primary_key=True, autoincrement=True))
     trading_symbol: Optional[str] = None
     security_id: Optional[str] = None
     exchange_segment: Optional[str] = None
-    timeframe: Optional[str] = None
+    # Daily, Hourly, 15 Min. Table models skip pydantic validation: a missing value fails at INSERT.
+    timeframe: str = Field(primary_key=True)
     datetime: Optional[datetime] = None
 
+    # raw prices stay double precision; derived indicators are stored as REAL (float4)
     open: Optional[float] = None
     high: Optional[float] = None
     low: Optional[float] = None
     close: Optional[float] = None
-    volume: Optional[float] = None
-    vwap: Optional[float] = None
-    volume_sma_10: Optional[float] = None
+    volume: Optional[int] = Field(default=None, sa_column=Column(BigInteger))
+    vwap: Optional[float] = Field(default=None, sa_column=Column(REAL))
+    volume_sma_10: Optional[float] = Field(default=None, sa_column=Column(REAL))
 
-    ha_open: Optional[float] = None
-    ha_high: Optional[float] = None
-    ha_low: Optional[float] = None
-    ha_close: Optional[float] = None
+    ha_open: Optional[float] = Field(default=None, sa_column=Column(REAL))
+    ha_high: Optional[float] = Field(default=None, sa_column=Column(REAL))
+    ha_low: Optional[float] = Field(default=None, sa_column=Column(REAL))
+    ha_close: Optional[float] = Field(default=None, sa_column=Column(REAL))
 
     # EMA
-    ema_5: Optional[float] = None
-    ema_13: Optional[float] = None
-    ema_26: Optional[float] = None
-    ema_50: Optional[float] = None
-    ema_100: Optional[float] = None
-    ema_200: Optional[float] = None
+    ema_5: Optional[float] = Field(default=None, sa_column=Column(REAL))
+    ema_13: Optional[float] = Field(default=None, sa_column=Column(REAL))
+    ema_26: Optional[float] = Field(default=None, sa_column=Column(REAL))
+    ema_50: Optional[float] = Field(default=None, sa_column=Column(REAL))
+    ema_100: Optional[float] = Field(default=None, sa_column=Column(REAL))
+    ema_200: Optional[float] = Field(default=None, sa_column=Column(REAL))
 
     # RSI, MACD
-    rsi_14: Optional[float] = None
-    macd_line: Optional[float] = None
-    macd_signal: Optional[float] = None
-    macd_hist: Optional[float] = None
+    rsi_14: Optional[float] = Field(default=None, sa_column=Column(REAL))
+    macd_line: Optional[float] = Field(default=None, sa_column=Column(REAL))
+    macd_signal: Optional[float] = Field(default=None, sa_column=Column(REAL))
+    macd_hist: Optional[float] = Field(default=None, sa_column=Column(REAL))
 
     # Stochastic
-    stochastic_k: Optional[float] = None
-    stochastic_d: Optional[float] = None
+    stochastic_k: Optional[float] = Field(default=None, sa_column=Column(REAL))
+    stochastic_d: Optional[float] = Field(default=None, sa_column=Column(REAL))
 
     # Bollinger Bands
-    bollinger_upper_2: Optional[float] = None
-    bollinger_middle_2: Optional[float] = None
-    bollinger_lower_2: Optional[float] = None
-    bollinger_upper_3: Optional[float] = None
-    bollinger_middle_3: Optional[float] = None
-    bollinger_lower_3: Optional[float] = None
+    bollinger_upper_2: Optional[float] = Field(default=None, sa_column=Column(REAL))
+    bollinger_middle_2: Optional[float] = Field(default=None, sa_column=Column(REAL))
+    bollinger_lower_2: Optional[float] = Field(default=None, sa_column=Column(REAL))
+    bollinger_upper_3: Optional[float] = Field(default=None, sa_column=Column(REAL))
+    bollinger_middle_3: Optional[float] = Field(default=None, sa_column=Column(REAL))
+    bollinger_lower_3: Optional[float] = Field(default=None, sa_column=Column(REAL))
 
     # DMI
-    plus_di_14: Optional[float] = None
-    minus_di_14: Optional[float] = None
-    adx_14: Optional[float] = None
+    plus_di_14: Optional[float] = Field(default=None, sa_column=Column(REAL))
+    minus_di_14: Optional[float] = Field(default=None, sa_column=Column(REAL))
+    adx_14: Optional[float] = Field(default=None, sa_column=Column(REAL))
 
     # Volatility
-    atr_14: Optional[float] = None
-    historic_volatility: Optional[float] = None
+    atr_14: Optional[float] = Field(default=None, sa_column=Column(REAL))
+    historic_volatility: Optional[float] = Field(default=None, sa_column=Column(REAL))
 
     # Supertrend
-    supertrend: Optional[str] = None  # Stored as 'True' or 'False' string
+    supertrend: Optional[bool] = None  # True = bullish, False = bearish
+
+
+# indicator_data is list-partitioned by timeframe; create the child tables alongside it
+_INDICATOR_PARTITIONS = {
+    "indicator_data_daily": "FOR VALUES IN ('Daily')",
+    "indicator_data_hourly": "FOR VALUES IN ('Hourly')",
+    "indicator_data_15min": "FOR VALUES IN ('15 Min')",
+    "indicator_data_default": "DEFAULT",
+}
+for _name, _bound in _INDICATOR_PARTITIONS.items():
+    event.listen(
+        IndicatorData.__table__,
+        "after_create",
+        DDL(f"CREATE TABLE IF NOT EXISTS {_name} PARTITION OF indicator_data {_bound}").execute_if(
+            dialect="postgresql"
+        ),
+    )